@@ -0,0 +1,53 @@
+from collections import Counter
+import json
+import re
+
+# Stored crawl results are a JSON list of article records:
+# {"session": ..., "url": ..., "title": ..., "translated_title": ...}
+# Keep this module stdlib-only so analysis runs without the scraping stack.
+
+def count_repeated_words(titles, min_count=3):
+    words = []
+    for title in titles:
+        # Using re.findall to get all words, then convert to lowercase
+        words.extend(re.findall(r'\b\w+\b', title.lower()))
+
+    word_freq = Counter(words)
+    return {word: freq for word, freq in word_freq.items() if freq >= min_count}
+
+
+# Human-readable names for the title fields of a stored record
+FIELD_LABELS = {"translated_title": "Translated Titles", "title": "Original Titles"}
+
+
+def print_repeated_words(titles, min_count=3, field="translated_title"):
+    label = FIELD_LABELS[field]
+    print(f"\n--- Consolidated Analysis of All {label} ---")
+    print(f"Words repeated more than {min_count - 1} times ({min_count} or more times):")
+    repeated_words = count_repeated_words(titles, min_count)
+    for word, freq in sorted(repeated_words.items(), key=lambda item: (-item[1], item[0])):
+        print(f"'{word}': {freq} times")
+
+    if not repeated_words:
+        print(f"No words were repeated more than {min_count - 1} times across all {label.lower()}.")
+    return repeated_words
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        try:
+            records = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path} is not valid JSON: {e}") from e
+    if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+        raise ValueError(f"{path} does not contain a list of article records")
+    return records
+
+
+def save_results(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+
+
+def titles_from_results(records, field="translated_title"):
+    return [record[field] for record in records if record.get(field)]
@@ -0,0 +1,208 @@
+import argparse
+import sys
+
+# Command-line entry point for the scraper.
+# Heavy dependencies (selenium, deep_translator, requests, ...) are imported inside
+# the subcommand that needs them, so analyzing stored results never pays for them.
+
+DEFAULT_RESULTS = "results.json"
+# Kept in sync with analysis.FIELD_LABELS; not imported so --help stays cheap
+FIELD_CHOICES = ["translated_title", "title"]
+
+
+def cmd_crawl(args):
+    import os
+
+    # Check before importing selenium; without credentials every session fails
+    if not os.getenv("USERNAME") or not os.getenv("ACCESS_KEY"):
+        print("error: set the USERNAME and ACCESS_KEY environment variables to your BrowserStack credentials", file=sys.stderr)
+        return 1
+
+    import threadingcode
+    from analysis import print_repeated_words, save_results, titles_from_results
+
+    caps_list = args.caps or threadingcode.BSTACK_CAPABILITIES
+    records = threadingcode.run_parallel_scrape(
+        caps_list,
+        max_workers=args.workers or len(caps_list),
+        section_url=args.section_url,
+        max_articles=args.max_articles,
+        image_dir=args.output_dir,
+        translate=not args.no_translate,
+    )
+    if not records:
+        # Keep any previously stored results rather than replacing them with an empty list
+        print(f"error: no articles were scraped, {args.results} left unchanged", file=sys.stderr)
+        return 1
+    save_results(args.results, records)
+    print(f"\nSaved {len(records)} article records to {args.results}")
+
+    if not args.no_translate:
+        print_repeated_words(titles_from_results(records))
+    return 0
+
+
+def cmd_translate_only(args):
+    from deep_translator import GoogleTranslator
+    from deep_translator.exceptions import InvalidSourceOrTargetLanguage, LanguageNotSupportedException
+    from analysis import load_results, save_results
+
+    records = load_results(args.results)
+    try:
+        translator = GoogleTranslator(source='auto', target=args.target)
+    except (InvalidSourceOrTargetLanguage, LanguageNotSupportedException):
+        print(f"error: unsupported target language: {args.target}", file=sys.stderr)
+        return 1
+    translated_count = 0
+    for record in records:
+        if not record.get("title") or (record.get("translated_title") and not args.force):
+            continue
+        try:
+            record["translated_title"] = translator.translate(record["title"])
+            translated_count += 1
+            print(f"Translated Title: {record['translated_title']}")
+        except Exception as e:
+            print(f"Translation failed for '{record['title']}': {e}")
+
+    output = args.output or args.results
+    save_results(output, records)
+    print(f"Translated {translated_count} titles, saved to {output}")
+    return 0
+
+
+def cmd_analyze(args):
+    from analysis import load_results, print_repeated_words, titles_from_results
+
+    records = load_results(args.results)
+    print_repeated_words(titles_from_results(records, args.field), args.min_count, args.field)
+    return 0
+
+
+def cmd_bench(args):
+    import time
+    from analysis import FIELD_LABELS, count_repeated_words, load_results, titles_from_results
+
+    start = time.perf_counter()
+    records = load_results(args.results)
+    load_time = time.perf_counter() - start
+
+    titles = titles_from_results(records, args.field)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        count_repeated_words(titles, args.min_count)
+        timings.append(time.perf_counter() - start)
+
+    print(f"Loaded {len(records)} records in {load_time * 1000:.2f} ms")
+    print(f"Analysis of {len(titles)} {FIELD_LABELS[args.field].lower()} over {args.repeat} runs: "
+          f"min {min(timings) * 1000:.3f} ms, mean {sum(timings) / len(timings) * 1000:.3f} ms")
+
+    if args.imports:
+        for module in ("cli", "threadingcode"):
+            import_time = cold_import_time(module)
+            if import_time is None:
+                print(f"Cold import of {module}: failed")
+            else:
+                print(f"Cold import of {module}: {import_time * 1000:.1f} ms")
+    return 0
+
+
+def cold_import_time(module):
+    # Import in a fresh interpreter so cached modules don't skew results, and read the
+    # module's cumulative time from -X importtime so interpreter startup isn't counted
+    import os
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:   self [us] |   cumulative | <indented module name>"
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2] == f" {module}":
+            return int(fields[1]) / 1_000_000
+    return None
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
+def caps_file(path):
+    import json
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            caps_list = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise argparse.ArgumentTypeError(f"cannot read capabilities from {path}: {e}")
+    if not isinstance(caps_list, list) or not caps_list or not all(isinstance(caps, dict) for caps in caps_list):
+        raise argparse.ArgumentTypeError(f"{path} must contain a non-empty list of capability objects")
+    return caps_list
+
+
+def section_url(value):
+    # The scrapers embed the URL in single-quoted XPath literals
+    if "'" in value:
+        raise argparse.ArgumentTypeError(f"section URL must not contain a single quote: {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Scrape El País articles on BrowserStack and analyze their titles.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    crawl = subparsers.add_parser("crawl", help="Scrape articles on BrowserStack and store the results")
+    crawl.add_argument("--section-url", type=section_url, default="https://elpais.com/opinion/", help="Section page to collect article links from")
+    crawl.add_argument("--max-articles", type=positive_int, default=5, help="Number of articles to open per session")
+    crawl.add_argument("--caps", type=caps_file, help="JSON file with a list of BrowserStack capability sets (default: built-in list)")
+    crawl.add_argument("--workers", type=positive_int, help="Parallel sessions (default: one per capability set)")
+    crawl.add_argument("--output-dir", default="downloaded_images", help="Directory for downloaded cover images")
+    crawl.add_argument("--results", default=DEFAULT_RESULTS, help="JSON file to store article records in")
+    crawl.add_argument("--no-translate", action="store_true", help="Skip title translation (use translate-only later)")
+    crawl.set_defaults(func=cmd_crawl)
+
+    translate = subparsers.add_parser("translate-only", help="Translate titles in stored results without scraping")
+    translate.add_argument("--results", default=DEFAULT_RESULTS, help="JSON file with stored article records")
+    translate.add_argument("--output", help="Where to write the updated records (default: overwrite --results)")
+    translate.add_argument("--target", default="en", help="Target language for translation")
+    translate.add_argument("--force", action="store_true", help="Re-translate titles that already have a translation")
+    translate.set_defaults(func=cmd_translate_only)
+
+    analyze = subparsers.add_parser("analyze", help="Report repeated words in stored titles")
+    analyze.add_argument("--results", default=DEFAULT_RESULTS, help="JSON file with stored article records")
+    analyze.add_argument("--field", default="translated_title", choices=FIELD_CHOICES, help="Which title to analyze")
+    analyze.add_argument("--min-count", type=positive_int, default=3, help="Report words appearing at least this many times")
+    analyze.set_defaults(func=cmd_analyze)
+
+    bench = subparsers.add_parser("bench", help="Time analysis of stored results")
+    bench.add_argument("--results", default=DEFAULT_RESULTS, help="JSON file with stored article records")
+    bench.add_argument("--field", default="translated_title", choices=FIELD_CHOICES, help="Which title to analyze")
+    bench.add_argument("--min-count", type=positive_int, default=3, help="Report words appearing at least this many times")
+    bench.add_argument("--repeat", type=positive_int, default=100, help="Number of timed analysis runs")
+    bench.add_argument("--imports", action="store_true", help="Also time cold imports of the CLI and the scraping module")
+    bench.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        # Missing, unreadable or malformed results files (json.JSONDecodeError is a ValueError)
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
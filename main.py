@@ -1,14 +1,9 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
-from webdriver_manager.chrome import ChromeDriverManager
-from deep_translator import GoogleTranslator
-from collections import Counter
-import requests
-import re
+from analysis import count_repeated_words
 import time
 import os
+from urllib.parse import urlparse
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
@@ -18,8 +13,9 @@ USERNAME = os.getenv("USERNAME")
 ACCESS_KEY = os.getenv("ACCESS_KEY")
 # Directory for saving images
 IMAGE_SAVE_DIR = "downloaded_images"
-if not os.path.exists(IMAGE_SAVE_DIR):
-    os.makedirs(IMAGE_SAVE_DIR)
+# Section to scrape and how many articles to open from it
+SECTION_URL = "https://elpais.com/opinion/"
+MAX_ARTICLES = 5
 
 # Helper function to handle cookie consent
 def accept_cookie_consent(driver, timeout=15):
@@ -50,8 +46,15 @@ def accept_cookie_consent(driver, timeout=15):
     return False
 
 # Function to scrape Opinion section using BrowserStack and analyze titles
-def scrape_opinion_translate_titles():
-    print("\n--- Opinion Article Titles (Translated) ---")
+def scrape_opinion_translate_titles(section_url=SECTION_URL, max_articles=MAX_ARTICLES, image_dir=IMAGE_SAVE_DIR, translate=True):
+    print(f"\n--- Article Titles from {section_url} (Translated) ---")
+    # The URL is embedded in single-quoted XPath literals below, which cannot escape quotes
+    if "'" in section_url:
+        raise ValueError(f"Section URL must not contain a single quote: {section_url}")
+    # Article links look like <section path>/<year>/..., e.g. /opinion/2025/...
+    section_prefix = section_url.rstrip('/') + '/202'
+    link_marker = urlparse(section_url).path.rstrip('/') + '/202'
+    article_list_xpath = f"//article[.//h2/a[contains(@href, '{link_marker}')] or .//h3/a[contains(@href, '{link_marker}')]]"
     # BrowserStack options
     bstack_options = {
         "os": "Windows",
@@ -71,6 +74,7 @@ def scrape_opinion_translate_titles():
     driver = None
     titles = []
     translated_titles = []
+    records = [] # One entry per processed article, for storing/analysis later
     
     try:
         driver = webdriver.Remote(
@@ -79,45 +83,45 @@ def scrape_opinion_translate_titles():
         )
         print("WebDriver initialized on BrowserStack.")
 
-        driver.get("https://elpais.com/opinion/")
-        print("Navigated to El País Opinion section.")
+        driver.get(section_url)
+        print(f"Navigated to {section_url}.")
         
-        # Handle cookie consent specifically for the Opinion page
+        # Handle cookie consent specifically for the section page
         accept_cookie_consent(driver)
 
         article_elements_on_page = WebDriverWait(driver, 20).until(
             EC.presence_of_all_elements_located((By.XPATH, 
-                "//article[.//h2/a[contains(@href, '/opinion/202')] or .//h3/a[contains(@href, '/opinion/202')]]"
+                article_list_xpath
             ))
         )
         
-        print(f"Found {len(article_elements_on_page)} potential article elements with specific links on Opinion page.")
+        print(f"Found {len(article_elements_on_page)} potential article elements with specific links on {section_url}.")
         
         articles_to_process = []
         processed_urls_set = set() # To store URLs already added to avoid duplicates
 
-        # Filter for unique and valid links from the first 5 found articles
+        # Filter for unique and valid links from the first max_articles found articles
         for idx, article_elem in enumerate(article_elements_on_page):
-            if len(articles_to_process) >= 5:
-                break # Stop after finding 5 articles
+            if len(articles_to_process) >= max_articles:
+                break # Stop after finding max_articles articles
 
             article_url = None
             try:
                 # Prioritize links within h2, then h3 that contain the year pattern
                 link_element = None
                 try:
-                    link_element = article_elem.find_element(By.XPATH, ".//h2/a[contains(@href, '/opinion/202')]")
+                    link_element = article_elem.find_element(By.XPATH, f".//h2/a[contains(@href, '{link_marker}')]")
                 except NoSuchElementException:
                     try:
-                        link_element = article_elem.find_element(By.XPATH, ".//h3/a[contains(@href, '/opinion/202')]")
+                        link_element = article_elem.find_element(By.XPATH, f".//h3/a[contains(@href, '{link_marker}')]")
                     except NoSuchElementException:
                         # Fallback: find any link within the article that looks like a full article URL
-                        link_element = article_elem.find_element(By.XPATH, ".//a[starts-with(@href, 'https://elpais.com/opinion/202')]")
+                        link_element = article_elem.find_element(By.XPATH, f".//a[starts-with(@href, '{section_prefix}')]")
                 
                 if link_element:
                     url = link_element.get_attribute("href")
                     # Further validate URL to ensure it's a specific article and not just a section
-                    if url and "elpais.com/opinion/202" in url and url not in processed_urls_set:
+                    if url and link_marker in url and url not in processed_urls_set:
                         article_url = url
                         
             except Exception as e:
@@ -130,8 +134,8 @@ def scrape_opinion_translate_titles():
 
 
         if not articles_to_process:
-            print("No valid specific article links found to process on the Opinion page based on current criteria.")
-            return
+            print(f"No valid specific article links found to process on {section_url} based on current criteria.")
+            return records
 
         print(f"Proceeding to scrape details for {len(articles_to_process)} unique articles...")
 
@@ -207,7 +211,11 @@ def scrape_opinion_translate_titles():
 
             # Translate Title - No change needed, already working
             translated = "Translation Failed"
-            if title != "Title Not Found" and title: # Ensure title is not empty string
+            if not translate:
+                translated = None
+                print("Skipping translation as requested.")
+            elif title != "Title Not Found" and title: # Ensure title is not empty string
+                from deep_translator import GoogleTranslator # Imported lazily; crawls without translation never load it
                 try:
                     translated = GoogleTranslator(source='auto', target='en').translate(title)
                     translated_titles.append(translated)
@@ -217,6 +225,13 @@ def scrape_opinion_translate_titles():
             else:
                 print("Skipping translation as title was not found or was empty.")
 
+            records.append({
+                "session": bstack_options["sessionName"],
+                "url": current_article_url,
+                "title": title if title != "Title Not Found" and title else None,
+                "translated_title": translated if translated != "Translation Failed" else None,
+            })
+
             # Download Cover Image - REFINED LOGIC HERE based on provided HTML
             try:
                 # Look for common image elements within the article (e.g., in a figure or directly)
@@ -249,11 +264,13 @@ def scrape_opinion_translate_titles():
                             base_filename += '.jpg' 
                         
                         filename = f"article_{i+1}_{base_filename}"
-                        full_path = os.path.join(IMAGE_SAVE_DIR, filename)
+                        full_path = os.path.join(image_dir, filename)
 
+                        import requests # Imported lazily, only when an image is downloaded
                         try:
                             response = requests.get(img_url, stream=True, timeout=10) # Added timeout for requests
                             response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
+                            os.makedirs(image_dir, exist_ok=True) # Only created once there is an image to save
                             with open(full_path, "wb") as f:
                                 for chunk in response.iter_content(chunk_size=8192):
                                     f.write(chunk)
@@ -267,12 +284,12 @@ def scrape_opinion_translate_titles():
             except Exception as e:
                 print(f"An unexpected error finding/downloading image for Article {i+1}: {e}")
 
-            # Go back to the Opinion section page for the next article
+            # Go back to the section page for the next article
             driver.back()
             # Wait for the article list to be visible again using the same robust XPath
             WebDriverWait(driver, 20).until(
                 EC.presence_of_all_elements_located((By.XPATH, 
-                    "//article[.//h2/a[contains(@href, '/opinion/202')] or .//h3/a[contains(@href, '/opinion/202')]]"
+                    article_list_xpath
                 ))
             )
 
@@ -285,17 +302,11 @@ def scrape_opinion_translate_titles():
 
     # Analyze repeated words
     print("\n--- Repeated Words in Translated Titles ---")
-    words = []
-    for title in translated_titles:
-        # Using re.findall to get all words, then convert to lowercase
-        words.extend(re.findall(r'\b\w+\b', title.lower()))
+    # Print words that appear more than twice (i.e., 3 or more times)
+    for word, freq in count_repeated_words(translated_titles).items():
+        print(f"'{word}': {freq} times")
+    return records
 
-    word_freq = Counter(words)
-    # Print words that appear more than twice
-    for word, freq in word_freq.items():
-        if freq > 2: # Changed condition to 'more than twice' (i.e., 3 or more times)
-            print(f"'{word}': {freq} times")
-            
 # Run only the Opinion section scraping
 if __name__ == "__main__":
-    scrape_opinion_translate_titles()
\ No newline at end of file
+    scrape_opinion_translate_titles()
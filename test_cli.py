@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+import cli
+from analysis import count_repeated_words, titles_from_results
+
+RECORDS = [
+    {"session": "a", "url": "u1", "title": "El rey", "translated_title": "The king of Spain"},
+    {"session": "a", "url": "u2", "title": "La guerra", "translated_title": "The king and the war"},
+    {"session": "b", "url": "u3", "title": None, "translated_title": None},
+]
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(RECORDS), encoding="utf-8")
+    return str(path)
+
+
+def test_count_repeated_words_min_count_boundary():
+    titles = ["the king", "The war", "the end", "war"]
+    assert count_repeated_words(titles, min_count=3) == {"the": 3}
+    assert count_repeated_words(titles, min_count=4) == {}
+    assert count_repeated_words(titles, min_count=2) == {"the": 3, "war": 2}
+
+
+def test_titles_from_results_skips_missing_fields():
+    assert titles_from_results(RECORDS) == ["The king of Spain", "The king and the war"]
+    assert titles_from_results(RECORDS, "title") == ["El rey", "La guerra"]
+    assert titles_from_results([{"url": "u"}]) == []
+
+
+def test_positive_int():
+    assert cli.positive_int("3") == 3
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.positive_int("0")
+    with pytest.raises(ValueError):
+        cli.positive_int("three")
+
+
+def test_analyze(results_file, capsys):
+    assert cli.main(["analyze", "--results", results_file]) == 0
+    out = capsys.readouterr().out
+    assert "'the': 3 times" in out
+    assert "king" not in out
+
+    assert cli.main(["analyze", "--results", results_file, "--min-count", "2"]) == 0
+    assert "'king': 2 times" in capsys.readouterr().out
+
+
+def test_analyze_labels_original_titles(results_file, capsys):
+    assert cli.main(["analyze", "--results", results_file, "--field", "title", "--min-count", "1"]) == 0
+    out = capsys.readouterr().out
+    assert "Analysis of All Original Titles" in out
+    assert "Translated" not in out
+
+    assert cli.main(["analyze", "--results", results_file, "--field", "title", "--min-count", "2"]) == 0
+    assert "across all original titles." in capsys.readouterr().out
+
+
+def test_bench(results_file, capsys):
+    assert cli.main(["bench", "--results", results_file, "--repeat", "3"]) == 0
+    out = capsys.readouterr().out
+    assert "Loaded 3 records" in out
+    assert "Analysis of 2 translated titles over 3 runs" in out
+
+
+@pytest.mark.parametrize("contents", [None, "{bad", '{"a": 1}', "[1]"])
+def test_bad_results_file(tmp_path, capsys, contents):
+    path = tmp_path / "results.json"
+    if contents is not None:
+        path.write_text(contents, encoding="utf-8")
+    assert cli.main(["analyze", "--results", str(path)]) == 1
+    assert capsys.readouterr().err.startswith("error: ")
+
+
+@pytest.mark.parametrize("contents", ["[]", "[1]", '{"os": "Windows"}', "{bad"])
+def test_crawl_rejects_bad_caps(tmp_path, contents):
+    path = tmp_path / "caps.json"
+    path.write_text(contents, encoding="utf-8")
+    with pytest.raises(SystemExit):
+        cli.main(["crawl", "--caps", str(path)])
+
+
+def test_crawl_requires_credentials(tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv("USERNAME", raising=False)
+    monkeypatch.setenv("ACCESS_KEY", "key")
+    assert cli.main(["crawl", "--results", str(tmp_path / "results.json")]) == 1
+    assert "USERNAME" in capsys.readouterr().err
+    assert not (tmp_path / "results.json").exists()
+
+
+def test_failed_crawl_keeps_stored_results(results_file, monkeypatch, capsys):
+    # Stand in for threadingcode so the test doesn't need selenium installed
+    fake_threadingcode = types.ModuleType("threadingcode")
+    fake_threadingcode.BSTACK_CAPABILITIES = [{"sessionName": "Test"}]
+    fake_threadingcode.run_parallel_scrape = lambda *args, **kwargs: []
+    monkeypatch.setitem(sys.modules, "threadingcode", fake_threadingcode)
+    monkeypatch.setenv("USERNAME", "user")
+    monkeypatch.setenv("ACCESS_KEY", "key")
+
+    with open(results_file, encoding="utf-8") as f:
+        before = f.read()
+    assert cli.main(["crawl", "--results", results_file]) == 1
+    assert "left unchanged" in capsys.readouterr().err
+    with open(results_file, encoding="utf-8") as f:
+        assert f.read() == before
+
+
+def test_crawl_rejects_quoted_section_url():
+    with pytest.raises(SystemExit):
+        cli.main(["crawl", "--section-url", "https://elpais.com/o'pinion/"])
+
+
+class FakeLanguageError(Exception):
+    pass
+
+
+class FakeGoogleTranslator:
+    def __init__(self, source="auto", target="en"):
+        if target not in ("en", "fr"):
+            raise FakeLanguageError(target)
+        self.target = target
+
+    def translate(self, text):
+        if text == "Falla":
+            raise RuntimeError("service unavailable")
+        return f"{self.target}:{text}"
+
+
+@pytest.fixture
+def fake_translator(monkeypatch):
+    # Stand in for deep_translator so the tests run offline and without the package
+    fake_module = types.ModuleType("deep_translator")
+    fake_module.GoogleTranslator = FakeGoogleTranslator
+    fake_exceptions = types.ModuleType("deep_translator.exceptions")
+    fake_exceptions.InvalidSourceOrTargetLanguage = FakeLanguageError
+    fake_exceptions.LanguageNotSupportedException = FakeLanguageError
+    monkeypatch.setitem(sys.modules, "deep_translator", fake_module)
+    monkeypatch.setitem(sys.modules, "deep_translator.exceptions", fake_exceptions)
+
+
+@pytest.fixture
+def untranslated_file(tmp_path):
+    records = [
+        {"session": "a", "url": "u1", "title": "El rey", "translated_title": None},
+        {"session": "a", "url": "u2", "title": "La guerra", "translated_title": "The war"},
+        {"session": "b", "url": "u3", "title": None, "translated_title": None},
+        {"session": "b", "url": "u4", "title": "Falla", "translated_title": None},
+    ]
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+    return path
+
+
+def load_titles(path):
+    with open(path, encoding="utf-8") as f:
+        return [record["translated_title"] for record in json.load(f)]
+
+
+def test_translate_only_skips_missing_and_translated_titles(fake_translator, untranslated_file, capsys):
+    assert cli.main(["translate-only", "--results", str(untranslated_file)]) == 0
+    out = capsys.readouterr().out
+    assert load_titles(untranslated_file) == ["en:El rey", "The war", None, None]
+    assert "Translation failed for 'Falla': service unavailable" in out
+    assert "Translated 1 titles" in out
+
+
+def test_translate_only_force_retranslates(fake_translator, untranslated_file):
+    assert cli.main(["translate-only", "--results", str(untranslated_file), "--force"]) == 0
+    assert load_titles(untranslated_file) == ["en:El rey", "en:La guerra", None, None]
+
+
+def test_translate_only_output_leaves_results_unchanged(fake_translator, untranslated_file, tmp_path):
+    before = untranslated_file.read_text(encoding="utf-8")
+    output = tmp_path / "translated.json"
+    assert cli.main(["translate-only", "--results", str(untranslated_file), "--output", str(output), "--target", "fr"]) == 0
+    assert untranslated_file.read_text(encoding="utf-8") == before
+    assert load_titles(output) == ["fr:El rey", "The war", None, None]
+
+
+def test_translate_only_rejects_unsupported_target(fake_translator, untranslated_file, capsys):
+    before = untranslated_file.read_text(encoding="utf-8")
+    assert cli.main(["translate-only", "--results", str(untranslated_file), "--target", "klingon"]) == 1
+    assert "unsupported target language: klingon" in capsys.readouterr().err
+    assert untranslated_file.read_text(encoding="utf-8") == before
+
+
+def test_cli_import_stays_light():
+    # Run in a fresh interpreter so modules imported by other tests don't leak in
+    heavy = ["selenium", "deep_translator", "requests", "bs4", "webdriver_manager", "threadingcode"]
+    code = (
+        "import sys, cli\n"
+        "cli.build_parser()\n"
+        f"print([name for name in {heavy!r} if name in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
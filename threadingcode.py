@@ -1,14 +1,9 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
-from webdriver_manager.chrome import ChromeDriverManager
-from deep_translator import GoogleTranslator
-from collections import Counter
-import requests
-import re
+from analysis import print_repeated_words
 import time
 import os
+from urllib.parse import urlparse
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
@@ -20,8 +15,9 @@ ACCESS_KEY = os.getenv("ACCESS_KEY")
 
 # Directory for saving images
 IMAGE_SAVE_DIR = "downloaded_images"
-if not os.path.exists(IMAGE_SAVE_DIR):
-    os.makedirs(IMAGE_SAVE_DIR)
+# Section to scrape and how many articles to open from it
+SECTION_URL = "https://elpais.com/opinion/"
+MAX_ARTICLES = 5
 
 # Helper function to handle cookie consent
 def accept_cookie_consent(driver, session_name, timeout=15):
@@ -52,9 +48,16 @@ def accept_cookie_consent(driver, session_name, timeout=15):
     return False
 
 
-def scrape_opinion_translate_titles(bstack_caps):
+def scrape_opinion_translate_titles(bstack_caps, section_url=SECTION_URL, max_articles=MAX_ARTICLES, image_dir=IMAGE_SAVE_DIR, translate=True):
     session_name = bstack_caps.get('sessionName', 'Unnamed Session')
     print(f"\n--- Starting test on {session_name} ---")
+    # The URL is embedded in single-quoted XPath literals below, which cannot escape quotes
+    if "'" in section_url:
+        raise ValueError(f"Section URL must not contain a single quote: {section_url}")
+    # Article links look like <section path>/<year>/..., e.g. /opinion/2025/...
+    section_prefix = section_url.rstrip('/') + '/202'
+    link_marker = urlparse(section_url).path.rstrip('/') + '/202'
+    article_list_xpath = f"//article[.//h2/a[contains(@href, '{link_marker}')] or .//h3/a[contains(@href, '{link_marker}')]]"
 
     options = webdriver.ChromeOptions() 
     options.set_capability('bstack:options', bstack_caps)
@@ -62,6 +65,7 @@ def scrape_opinion_translate_titles(bstack_caps):
     driver = None
     titles = []
     translated_titles = []
+    records = [] # One entry per processed article, for storing/analysis later
     
     try:
         driver = webdriver.Remote(
@@ -70,43 +74,43 @@ def scrape_opinion_translate_titles(bstack_caps):
         )
         print(f"[{session_name}] WebDriver initialized on BrowserStack.")
 
-        driver.get("https://elpais.com/opinion/")
-        print(f"[{session_name}] Navigated to El País Opinion section.")
+        driver.get(section_url)
+        print(f"[{session_name}] Navigated to {section_url}.")
         
-        # Handle cookie consent specifically for the Opinion page, passing session_name
+        # Handle cookie consent specifically for the section page, passing session_name
         accept_cookie_consent(driver, session_name)
 
-        # Wait for article elements to be present and identify the first 5 unique articles
+        # Wait for article elements to be present and identify the first max_articles unique articles
         article_elements_on_page = WebDriverWait(driver, 20).until(
             EC.presence_of_all_elements_located((By.XPATH, 
-                "//article[.//h2/a[contains(@href, '/opinion/202')] or .//h3/a[contains(@href, '/opinion/202')]]"
+                article_list_xpath
             ))
         )
         
-        print(f"[{session_name}] Found {len(article_elements_on_page)} potential article elements with specific links on Opinion page.")
+        print(f"[{session_name}] Found {len(article_elements_on_page)} potential article elements with specific links on {section_url}.")
         
         articles_to_process = []
         processed_urls_set = set() # To store URLs already added to avoid duplicates
 
-        # Filter for unique and valid links from the first 5 found articles
+        # Filter for unique and valid links from the first max_articles found articles
         for idx, article_elem in enumerate(article_elements_on_page):
-            if len(articles_to_process) >= 5:
-                break # Stop after finding 5 articles
+            if len(articles_to_process) >= max_articles:
+                break # Stop after finding max_articles articles
 
             article_url = None
             try:
                 link_element = None
                 try:
-                    link_element = article_elem.find_element(By.XPATH, ".//h2/a[contains(@href, '/opinion/202')]")
+                    link_element = article_elem.find_element(By.XPATH, f".//h2/a[contains(@href, '{link_marker}')]")
                 except NoSuchElementException:
                     try:
-                        link_element = article_elem.find_element(By.XPATH, ".//h3/a[contains(@href, '/opinion/202')]")
+                        link_element = article_elem.find_element(By.XPATH, f".//h3/a[contains(@href, '{link_marker}')]")
                     except NoSuchElementException:
-                        link_element = article_elem.find_element(By.XPATH, ".//a[starts-with(@href, 'https://elpais.com/opinion/202')]")
+                        link_element = article_elem.find_element(By.XPATH, f".//a[starts-with(@href, '{section_prefix}')]")
                 
                 if link_element:
                     url = link_element.get_attribute("href")
-                    if url and "elpais.com/opinion/202" in url and url not in processed_urls_set:
+                    if url and link_marker in url and url not in processed_urls_set:
                         article_url = url
                         
             except Exception as e:
@@ -119,8 +123,8 @@ def scrape_opinion_translate_titles(bstack_caps):
 
 
         if not articles_to_process:
-            print(f"[{session_name}] No valid specific article links found to process on the Opinion page based on current criteria.")
-            return [] # Return empty list if no articles found
+            print(f"[{session_name}] No valid specific article links found to process on {section_url} based on current criteria.")
+            return records # Return empty list if no articles found
 
         print(f"[{session_name}] Proceeding to scrape details for {len(articles_to_process)} unique articles...")
 
@@ -190,7 +194,11 @@ def scrape_opinion_translate_titles(bstack_caps):
 
             # Translate Title
             translated = "Translation Failed"
-            if title != "Title Not Found" and title:
+            if not translate:
+                translated = None
+                print(f"[{session_name}] Skipping translation as requested.")
+            elif title != "Title Not Found" and title:
+                from deep_translator import GoogleTranslator # Imported lazily; crawls without translation never load it
                 try:
                     translated = GoogleTranslator(source='auto', target='en').translate(title)
                     translated_titles.append(translated)
@@ -200,6 +208,13 @@ def scrape_opinion_translate_titles(bstack_caps):
             else:
                 print(f"[{session_name}] Skipping translation as title was not found or was empty.")
 
+            records.append({
+                "session": session_name,
+                "url": current_article_url,
+                "title": title if title != "Title Not Found" and title else None,
+                "translated_title": translated if translated != "Translation Failed" else None,
+            })
+
             # Download Cover Image - REFINED LOGIC
             try:
                 img_element = WebDriverWait(driver, 15).until(
@@ -228,11 +243,13 @@ def scrape_opinion_translate_titles(bstack_caps):
                             base_filename += '.jpg' 
                         
                         filename = f"article_{i+1}_{session_name.replace(' ', '_')}_{base_filename}" # Unique filename per session
-                        full_path = os.path.join(IMAGE_SAVE_DIR, filename)
+                        full_path = os.path.join(image_dir, filename)
 
+                        import requests # Imported lazily, only when an image is downloaded
                         try:
                             response = requests.get(img_url, stream=True, timeout=10)
                             response.raise_for_status()
+                            os.makedirs(image_dir, exist_ok=True) # Only created once there is an image to save
                             with open(full_path, "wb") as f:
                                 for chunk in response.iter_content(chunk_size=8192):
                                     f.write(chunk)
@@ -249,7 +266,7 @@ def scrape_opinion_translate_titles(bstack_caps):
             driver.back()
             WebDriverWait(driver, 20).until(
                 EC.presence_of_all_elements_located((By.XPATH, 
-                    "//article[.//h2/a[contains(@href, '/opinion/202')] or .//h3/a[contains(@href, '/opinion/202')]]"
+                    article_list_xpath
                 ))
             )
 
@@ -261,108 +278,98 @@ def scrape_opinion_translate_titles(bstack_caps):
         if driver:
             driver.quit()
             print(f"[{session_name}] WebDriver closed.")
-    return translated_titles
+    return records
 
-# Main execution block for parallel testing
-if __name__ == "__main__":
-    # Define capabilities for 5 parallel tests (combination of desktop and mobile)
-    bstack_capabilities_list = [
-        # Desktop 1: Windows 10, Chrome latest
-        {
-            "os": "Windows",
-            "osVersion": "10",
-            "browserName": "Chrome",
-            "browserVersion": "latest",
-            "sessionName": "Win10 Chrome Test",
-            "buildName": "El Pais Parallel Scrape",
-            "debug": "true",
-            "networkLogs": "true",
-            "consoleLogs": "debug",
-            "seleniumVersion": "4.0.0" 
-        },
-        # Desktop 2: macOS Sonoma, Safari latest
-        {
-            "os": "OS X",
-            "osVersion": "Sonoma", 
-            "browserName": "Safari", 
-            "browserVersion": "latest",
-            "sessionName": "Mac Sonoma Safari Test", 
-            "buildName": "El Pais Parallel Scrape",
-            "debug": "true",
-            "networkLogs": "true",
-            "consoleLogs": "debug",
-            "seleniumVersion": "4.0.0"
-        },
-        # Desktop 3: Windows 11, Edge latest
-        {
-            "os": "Windows",
-            "osVersion": "11",
-            "browserName": "Edge",
-            "browserVersion": "latest",
-            "sessionName": "Win11 Edge Test",
-            "buildName": "El Pais Parallel Scrape",
-            "debug": "true",
-            "networkLogs": "true",
-            "consoleLogs": "debug",
-            "seleniumVersion": "4.0.0"
-        },
-        # Mobile 1: Android (e.g., Samsung Galaxy S23, Chrome) - Real device
-        {
-            "deviceName": "Samsung Galaxy S23",
-            "osVersion": "13.0", 
-            "browserName": "Chrome",
-            "realMobile": "true",
-            "sessionName": "Android S23 Chrome Test",
-            "buildName": "El Pais Parallel Scrape",
-            "debug": "true",
-            "networkLogs": "true",
-            "consoleLogs": "debug",
-            "seleniumVersion": "4.0.0"
-        },
-        # Mobile 2: iOS (e.g., iPhone 14 Pro, Safari) - Real device
-        {
-            "deviceName": "iPhone 14 Pro",
-            "osVersion": "16", # iOS 16
-            "browserName": "Safari",
-            "realMobile": "true", 
-            "sessionName": "iPhone 14 Pro Safari Test",
-            "buildName": "El Pais Parallel Scrape",
-            "debug": "true",
-            "networkLogs": "true",
-            "consoleLogs": "debug",
-            "seleniumVersion": "4.0.0"
-        }
-    ]
-
-    all_translated_titles = []
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_caps = {executor.submit(scrape_opinion_translate_titles, caps): caps for caps in bstack_capabilities_list}
+# Capabilities for 5 parallel tests (combination of desktop and mobile)
+BSTACK_CAPABILITIES = [
+    # Desktop 1: Windows 10, Chrome latest
+    {
+        "os": "Windows",
+        "osVersion": "10",
+        "browserName": "Chrome",
+        "browserVersion": "latest",
+        "sessionName": "Win10 Chrome Test",
+        "buildName": "El Pais Parallel Scrape",
+        "debug": "true",
+        "networkLogs": "true",
+        "consoleLogs": "debug",
+        "seleniumVersion": "4.0.0" 
+    },
+    # Desktop 2: macOS Sonoma, Safari latest
+    {
+        "os": "OS X",
+        "osVersion": "Sonoma", 
+        "browserName": "Safari", 
+        "browserVersion": "latest",
+        "sessionName": "Mac Sonoma Safari Test", 
+        "buildName": "El Pais Parallel Scrape",
+        "debug": "true",
+        "networkLogs": "true",
+        "consoleLogs": "debug",
+        "seleniumVersion": "4.0.0"
+    },
+    # Desktop 3: Windows 11, Edge latest
+    {
+        "os": "Windows",
+        "osVersion": "11",
+        "browserName": "Edge",
+        "browserVersion": "latest",
+        "sessionName": "Win11 Edge Test",
+        "buildName": "El Pais Parallel Scrape",
+        "debug": "true",
+        "networkLogs": "true",
+        "consoleLogs": "debug",
+        "seleniumVersion": "4.0.0"
+    },
+    # Mobile 1: Android (e.g., Samsung Galaxy S23, Chrome) - Real device
+    {
+        "deviceName": "Samsung Galaxy S23",
+        "osVersion": "13.0", 
+        "browserName": "Chrome",
+        "realMobile": "true",
+        "sessionName": "Android S23 Chrome Test",
+        "buildName": "El Pais Parallel Scrape",
+        "debug": "true",
+        "networkLogs": "true",
+        "consoleLogs": "debug",
+        "seleniumVersion": "4.0.0"
+    },
+    # Mobile 2: iOS (e.g., iPhone 14 Pro, Safari) - Real device
+    {
+        "deviceName": "iPhone 14 Pro",
+        "osVersion": "16", # iOS 16
+        "browserName": "Safari",
+        "realMobile": "true", 
+        "sessionName": "iPhone 14 Pro Safari Test",
+        "buildName": "El Pais Parallel Scrape",
+        "debug": "true",
+        "networkLogs": "true",
+        "consoleLogs": "debug",
+        "seleniumVersion": "4.0.0"
+    }
+]
+
+
+# Run one scrape per capability set in parallel and collect all article records
+def run_parallel_scrape(bstack_capabilities_list=BSTACK_CAPABILITIES, max_workers=5, **scrape_kwargs):
+    all_records = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_caps = {executor.submit(scrape_opinion_translate_titles, caps, **scrape_kwargs): caps for caps in bstack_capabilities_list}
 
         for future in concurrent.futures.as_completed(future_to_caps):
             caps = future_to_caps[future]
             session_name = caps.get('sessionName', 'Unnamed Session')
             try:
-                translated_titles_from_thread = future.result() 
-                if translated_titles_from_thread:
-                    all_translated_titles.extend(translated_titles_from_thread)
+                records_from_thread = future.result() 
+                if records_from_thread:
+                    all_records.extend(records_from_thread)
             except Exception as exc:
                 print(f'[{session_name}] Test generated an exception: {exc}')
-    
-    print("\n--- Consolidated Analysis of All Translated Titles ---")
-    words = []
-    for title in all_translated_titles:
-        words.extend(re.findall(r'\b\w+\b', title.lower()))
+    return all_records
 
-    word_freq = Counter(words)
-    
-    # Print words that appear more than twice (i.e., frequency > 2)
-    print("Words repeated more than twice (3 or more times):")
-    found_repeated_words = False
-    for word, freq in word_freq.items():
-        if freq > 2: 
-            print(f"'{word}': {freq} times")
-            found_repeated_words = True
-    
-    if not found_repeated_words:
-        print("No words were repeated more than twice across all translated headers.")
\ No newline at end of file
+
+# Main execution block for parallel testing
+if __name__ == "__main__":
+    all_records = run_parallel_scrape()
+    print_repeated_words([record["translated_title"] for record in all_records if record["translated_title"]])